@@ -1,5 +1,5 @@
 import gradio as gr
-import requests
+import httpx
 import logging
 
 from src.configurator import Configurator
@@ -12,14 +12,28 @@ logging.basicConfig(level=logging.INFO, format=fmt)
 
 config = Configurator()
 
+# One keep-alive client for all chat turns -- a fresh post() would pay a new
+# TCP+TLS handshake on every message. httpx also takes the pre-parsed URL
+# from DeploymentConfig as-is, skipping per-request URL parsing.
+SESSION = httpx.Client(limits=httpx.Limits(max_connections=10, max_keepalive_connections=10), timeout=30)
+
+
+def chat_with_backend(user_input, message_history, display):
+    # Restored history with no display yet: roles strictly alternate
+    # user/assistant, so pair the even/odd slices -- strided iteration in C,
+    # no per-message role check
+    if message_history and not display:
+        display = list(zip(
+            (m["content"] for m in message_history[0::2]),
+            (m["content"] for m in message_history[1::2])
+        ))
 
-def chat_with_backend(user_input, message_history):
     # Add current user message to the history
     message_history.append({"role": "user", "content": user_input})
 
     try:
         # Send full history to backend
-        response = requests.post(config.deployment_config.api, json={"messages": message_history})
+        response = SESSION.post(config.deployment_config.api_url, json={"messages": message_history})
         assistant_reply = response.json().get("response", "[No response]")
     except Exception as e:
         assistant_reply = f"[Error] {str(e)}"
@@ -27,18 +41,15 @@ def chat_with_backend(user_input, message_history):
     # Append assistant's reply to the history
     message_history.append({"role": "assistant", "content": assistant_reply})
 
-    # Return formatted messages for Chatbot display
-    chatbot_display = [
-        (m["content"], message_history[i + 1]["content"])
-        for i, m in enumerate(message_history[:-1])
-        if m["role"] == "user"
-    ]
+    # Append just the newest turn -- rebuilding the display from the full history
+    # every turn was O(n^2) over a conversation
+    display.append((user_input, assistant_reply))
 
-    return chatbot_display, message_history
+    return display, message_history, display
 
 
 def clear_chat():
-    return [], []  # Empty display and message history
+    return [], [], []  # Empty display and message history
 
 
 if __name__ == "__main__":
@@ -57,12 +68,15 @@ if __name__ == "__main__":
             clear = gr.Button("Clear Conversation")
 
         message_history = gr.State([])  # List of {"role": ..., "content": ...}
+        display_state = gr.State([])  # List of (user, assistant) pairs shown in the Chatbot
 
-        submit.click(chat_with_backend, inputs=[msg, message_history], outputs=[chatbot, message_history])
-        msg.submit(chat_with_backend, inputs=[msg, message_history], outputs=[chatbot, message_history])
+        submit.click(chat_with_backend, inputs=[msg, message_history, display_state],
+                     outputs=[chatbot, message_history, display_state])
+        msg.submit(chat_with_backend, inputs=[msg, message_history, display_state],
+                   outputs=[chatbot, message_history, display_state])
 
         # Clear button logic
-        clear.click(fn=clear_chat, inputs=[], outputs=[chatbot, message_history])
+        clear.click(fn=clear_chat, inputs=[], outputs=[chatbot, message_history, display_state])
 
     demo.launch(
         server_name=config.deployment_config.app_cfg.host,
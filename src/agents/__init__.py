@@ -3,7 +3,9 @@ from __future__ import annotations  # https://peps.python.org/pep-0563/
 from atomic_agents.agents.base_agent import BaseAgent, BaseAgentConfig, BaseIOSchema
 from atomic_agents.lib.components.system_prompt_generator import SystemPromptGenerator
 from atomic_agents.lib.components.agent_memory import AgentMemory, Message
+import functools
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, Type, TYPE_CHECKING
 
@@ -20,6 +22,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _read_prompt(prompt_file: str, mtime: float) -> Dict:
+    """Parsed prompt YAML, memoized on (file, mtime) so re-configuring agents
+    doesn't re-read and re-parse from disk. The mtime key invalidates on edit."""
+    return PromptHandler(prompt_file).read()
+
+
 class AgentHandler(object):
 
     def __init__(self, config: cfg.Configurator):
@@ -54,7 +63,7 @@ class AgentHandler(object):
             output_schema: Optional[Type[BaseIOSchema]]
     ) -> BaseAgent:
         prompt_loc = self.config.agent_config_map[agent_name]
-        prompt = PromptHandler(prompt_loc).read()
+        prompt = _read_prompt(prompt_loc, os.path.getmtime(self.prompt_dir / prompt_loc))
         return BaseAgent(
             BaseAgentConfig(
                 client=self.config.get_openrouter_client(),
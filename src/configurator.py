@@ -1,10 +1,19 @@
 from dataclasses import dataclass
+import httpx
 from instructor import from_openai, Instructor, Mode
 import logging
 from openai import OpenAI
+import os
 from pathlib import Path
-from typing import Dict
-from yaml import safe_load
+import pickle
+from typing import Dict, Optional
+import yaml
+
+try:
+    # libyaml bindings parse ~10x faster than the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 
 logger = logging.getLogger(__name__)
@@ -28,6 +37,9 @@ class DeploymentConfig:
     app_cfg: ConnectionConfig = None
     api: str = None
     app: str = None
+    # Parsed once so clients skip URL tokenization on every request
+    api_url: httpx.URL = None
+    app_url: httpx.URL = None
 
 
 @dataclass
@@ -53,6 +65,47 @@ class DataConfig:
     search_engine_num_queries: int = None
 
 
+def _scan_files(directory: Path, suffix: str):
+    """File paths under ``directory`` matching ``suffix``, via one scandir pass.
+
+    DirEntry caches the type info from the readdir syscall, so unlike Path.glob
+    this doesn't stat each entry or build a Path object per file.
+    """
+    if not os.path.isdir(directory):
+        return []
+    return sorted(e.path for e in os.scandir(directory) if e.is_file() and e.name.endswith(suffix))
+
+
+def _load_cached(path: Path, loader):
+    """Parse a YAML file through ``loader``, keeping a pickle sidecar keyed by mtime.
+
+    Re-parsing the configs with safe_load on every startup is slow; unpickling the
+    already-built objects is not. The sidecar is rebuilt whenever the YAML is newer.
+    """
+    cache = path.with_suffix(path.suffix + ".pkl")
+    if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+        try:
+            with open(cache, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            # Torn or stale sidecar -- fall through and rebuild it from the YAML
+            logger.warning(f"Ignoring unreadable config cache {cache}: {e}")
+
+    with open(path, "r") as f:
+        obj = loader(yaml.load(f, Loader=SafeLoader))
+    try:
+        # Write-then-replace so a crash mid-dump can't leave a torn sidecar
+        # that passes the freshness check on the next startup
+        tmp = cache.with_suffix(cache.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(obj, f)
+        os.replace(tmp, cache)
+    except OSError as e:
+        # e.g. read-only config dir: just parse every startup
+        logger.warning(f"Could not write config cache {cache}: {e}")
+    return obj
+
+
 def assert_present(filename: Path):
     try:
         assert filename.exists()
@@ -65,15 +118,16 @@ class Configurator:
     def __init__(self):
         self.base_dir = BASE_DIR
         self.config_dir = BASE_DIR / "config"
-        self.config_files = list(Path(self.config_dir).glob("*.yml"))
+        self.config_files = _scan_files(self.config_dir, ".yml")
         self.data_dir = BASE_DIR / "data" / "processed"
-        self.data_files = list(self.data_dir.glob("*.json"))
+        self.data_files = _scan_files(self.data_dir, ".json")
 
         # ALL THE CONFIGS
         self.deployment_config = self.configure_deployment()
         self.api_config: APIConfig = APIConfig()
         self.agent_config_map: Dict[str, str] = {}
         self.data_config: DataConfig = DataConfig()
+        self._openrouter_client: Optional[Instructor] = None
         self.configured = False
         self.configure()
 
@@ -87,44 +141,49 @@ class Configurator:
     def __load_api_yml(self):
         api_config = self.config_dir / "api.yml"
         assert_present(api_config)
-        with open(api_config, "r") as f:
-            return APIConfig(**safe_load(f))
+        return _load_cached(api_config, lambda d: APIConfig(**d))
 
     def __load_data_yml(self):
         data_config = self.config_dir / "data.yml"
         assert_present(data_config)
-        with open(data_config, "r") as f:
-            return DataConfig(**safe_load(f))
+        return _load_cached(data_config, lambda d: DataConfig(**d))
 
     def __load_agents_yml(self):
         agent_config = self.config_dir / "agents.yml"
         assert_present(agent_config)
-        with open(agent_config, "r") as f:
-            return {a["agent_name"]: a["prompt"] for a in safe_load(f)["agents"]}
+        return _load_cached(agent_config, lambda d: {a["agent_name"]: a["prompt"] for a in d["agents"]})
 
     def get_openrouter_client(self) -> Instructor:
-        return from_openai(
-            OpenAI(
-                base_url=self.api_config.openrouter_endpoint,
-                api_key=self.api_config.openrouter_key
+        # Built lazily, once -- each OpenAI() sets up its own httpx client and TLS
+        # context, and every agent can share one pooled transport
+        if self._openrouter_client is None:
+            self._openrouter_client = from_openai(
+                OpenAI(
+                    base_url=self.api_config.openrouter_endpoint,
+                    api_key=self.api_config.openrouter_key
+                )
+                , mode=Mode.JSON
             )
-            , mode=Mode.JSON
-        )
+        return self._openrouter_client
 
     def configure_deployment(self) -> DeploymentConfig:
         app_cfg = ConnectionConfig(host="localhost", port=8080)
         api_cfg = ConnectionConfig(host="localhost", port=8081)
         if (self.config_dir / "deployment.yml").exists():
             logger.info("Loading server config from file")
-            with open(self.config_dir / "deployment.yml", "r") as f:
-                config = safe_load(f)
-                app_cfg = ConnectionConfig(**config["app"])
-                api_cfg = ConnectionConfig(**config["api"])
+            app_cfg, api_cfg = _load_cached(
+                self.config_dir / "deployment.yml",
+                lambda d: (ConnectionConfig(**d["app"]), ConnectionConfig(**d["api"]))
+            )
 
+        api = f"http://{api_cfg.host}:{api_cfg.port}/{api_cfg.endpoint}?debug={api_cfg.debug}"
+        app = f"http://{app_cfg.host}:{app_cfg.port}/{app_cfg.endpoint}?debug={app_cfg.debug}"
         return DeploymentConfig(
             app_cfg=app_cfg,
             api_cfg=api_cfg,
-            api=f"http://{api_cfg.host}:{api_cfg.port}/{api_cfg.endpoint}?debug={api_cfg.debug}",
-            app=f"http://{app_cfg.host}:{app_cfg.port}/{app_cfg.endpoint}?debug={app_cfg.debug}"
+            api=api,
+            app=app,
+            api_url=httpx.URL(api),
+            app_url=httpx.URL(app)
         )
 
@@ -1,16 +1,17 @@
 import chromadb
-import itertools as it
-from itertools import zip_longest as itzip
+import concurrent.futures
 import logging
+import numpy as np
+import orjson
 import os
 import shutil
-import simplejson as sj
 import tiktoken as tt
 from typing import Dict, List, Optional, Tuple
 import uuid
 
 from src.configurator import Configurator
 from src.types import QueryResult, Chunk, SearchResultItem
+from src.utils import OpenAIEmbeddingFunction
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,41 @@ logger = logging.getLogger(__name__)
 _BATCH_SIZE = 200  # May run into errors if chunk size is large
 
 
+def _token_windows(tokens: List[int], chunk_size: int, stride: int) -> List[List[int]]:
+    """Sliding windows over a token list, vectorized with a NumPy strided view.
+
+    The full windows come out of one C-level sliding_window_view; only the short
+    tail windows (starts past len - chunk_size) fall back to Python slices.
+    """
+    n = len(tokens)
+    if n <= chunk_size:
+        # Short document: every window is a tail slice
+        return [tokens[s:] for s in range(0, n, stride)]
+
+    arr = np.asarray(tokens, dtype=np.int32)
+    full = np.lib.stride_tricks.sliding_window_view(arr, chunk_size)[::stride]
+    windows = full.tolist()
+    for s in range(len(windows) * stride, n, stride):
+        windows.append(tokens[s:])
+    return windows
+
+
+def _chunk_file(fn, tokenizer: str, chunk_size: int, overlap: int) -> Tuple[List[str], List[Dict[str, str]]]:
+    """Load one processed JSON file and tokenize + chunk it.
+
+    Module-level (and taking plain args) so ProcessPoolExecutor workers can pickle
+    it; tiktoken's registry caches the encoding per worker process.
+    """
+    with open(fn, 'rb') as f:
+        file_json = orjson.loads(f.read())
+
+    enc = tt.get_encoding(tokenizer)
+    tokens = enc.encode_ordinary(file_json["document"])
+    windows = _token_windows(tokens, chunk_size, chunk_size - overlap)
+    chunks = enc.decode_batch(windows)
+    return chunks, [file_json["metadata"]] * len(chunks)
+
+
 class ChromaDBService:
     """Service for interacting with ChromaDB using OpenAI embeddings."""
 
@@ -45,7 +81,7 @@ class ChromaDBService:
         self.config = config
 
         # Initialize embedding function with OpenAI
-        self.embedding_function = chromadb.utils.embedding_functions.OpenAIEmbeddingFunction(
+        self.embedding_function = OpenAIEmbeddingFunction(
             api_key=self.config.api_config.openai_key
             , model_name=self.config.data_config.embedding_model
         )
@@ -65,27 +101,35 @@ class ChromaDBService:
             metadata={"hnsw:space": self.config.data_config.distance_metric},  # Explicitly set distance metric
         )
 
-        # Tokenizer
-        self.encode = lambda x: tt.get_encoding(self.config.data_config.embedding_model_tokenizer).encode(x)
-        self.decode = lambda x: tt.get_encoding(self.config.data_config.embedding_model_tokenizer).decode(x)
-        self.get_tokens = lambda x: len(self.encode(x))
+        # Tokenizer -- build the encoding once; get_encoding re-reads the BPE table
+        # on every call otherwise
+        self._enc = tt.get_encoding(self.config.data_config.embedding_model_tokenizer)
+        self.encode = self._enc.encode
+        self.decode = self._enc.decode
+        # Ingested text is plain user text -- encode_ordinary skips the
+        # special-token regex scan
+        self.get_tokens = lambda x: len(self._enc.encode_ordinary(x))
 
     def initialize_db(self) -> List[str]:
-        data = []
-        for fn in self.config.data_files:
-            with open(fn, 'r+') as f:
-                data.append(sj.load(f))
-
-        chunks, metadatas = [], []
-        for d in data:
-            try:
-                _ch, _md = self.get_chunks_and_metadatas(d)
-            except Exception as e:
-                raise Exception(f"error reading file with metadata {d['metadata']}, details follow ... {e}")
-            chunks.extend(_ch)
-            metadatas.extend(_md)
-
-        return self.add_documents(documents=chunks, metadatas=metadatas)
+        # CPU stage (tokenize + chunk) fans out over a process pool; the main
+        # thread consumes completed files and pushes them to collection.add, so
+        # chunking overlaps with the outbound embedding calls
+        dc = self.config.data_config
+        ids = []
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            future_to_file = {
+                executor.submit(_chunk_file, fn, dc.embedding_model_tokenizer, dc.db_chunk_size, dc.db_chunk_overlap): fn
+                for fn in self.config.data_files
+            }
+            for future in concurrent.futures.as_completed(future_to_file):
+                fn = future_to_file[future]
+                try:
+                    chunks, metadatas = future.result()
+                except Exception as e:
+                    raise Exception(f"error reading file {fn}, details follow ... {e}")
+                ids.extend(self.add_documents(documents=chunks, metadatas=metadatas))
+
+        return ids
 
     def add_documents(
         self,
@@ -111,12 +155,20 @@ class ChromaDBService:
             metadatas = [{} for _ in documents]
 
         # https://github.com/openai/openai-python/issues/519
-        assert not any(d is None for d in documents)  # no null dox!
-        _docs = it.batched(documents, _BATCH_SIZE)
-        _mds = it.batched(metadatas, _BATCH_SIZE)
-        _ids = it.batched(ids, _BATCH_SIZE)
-        for (_d, _m, _i) in zip(_docs, _mds, _ids):
-            self.collection.add(documents=list(_d), metadatas=list(_m), ids=list(_i))
+        # Single pass: the null-doc check rides along with batching instead of a
+        # separate O(N) any() scan plus three zipped batched() iterators
+        _d, _m, _i = [], [], []
+        for doc, md, id_ in zip(documents, metadatas, ids):
+            if doc is None:
+                raise ValueError(f"null document for id {id_}")  # no null dox!
+            _d.append(doc)
+            _m.append(md)
+            _i.append(id_)
+            if len(_d) == _BATCH_SIZE:
+                self.collection.add(documents=_d, metadatas=_m, ids=_i)
+                _d, _m, _i = [], [], []
+        if _d:
+            self.collection.add(documents=_d, metadatas=_m, ids=_i)
         return ids
 
     def add_search_results(self, search_results: List[SearchResultItem]) -> List[str]:
@@ -189,15 +241,15 @@ class ChromaDBService:
 
     def get_chunks_and_metadatas(self, file_json: dict) -> Tuple[List[str], List[Dict[str, str]]]:
         """Split the document into chunks with overlap. Factor this out?"""
-        document = self.encode(file_json["document"])
+        document = self._enc.encode_ordinary(file_json["document"])
         chunk_size = self.config.data_config.db_chunk_size
         overlap = self.config.data_config.db_chunk_overlap
 
-        def _yield_chunks():
-            for x in itzip(*[document[i::chunk_size - overlap] for i in range(chunk_size)]):
-                yield tuple(i for i in x if i is not None) if x[-1] is None else x
-
-        chunks = [self.decode(x) for x in _yield_chunks()]
+        # Same windows as before (stride = chunk_size - overlap, short tail kept),
+        # extracted in C via the strided view instead of a Python slice loop
+        windows = _token_windows(document, chunk_size, chunk_size - overlap)
+        # decode_batch crosses the FFI boundary once and decodes windows in parallel
+        chunks = self._enc.decode_batch(windows)
         return chunks, [file_json["metadata"]]*len(chunks)
 
 
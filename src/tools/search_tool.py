@@ -1,17 +1,22 @@
 from googlesearch import search
-from bs4 import BeautifulSoup
-import concurrent.futures
-import threading
+from bs4 import BeautifulSoup, SoupStrainer
+import asyncio
+import httpx
 from typing import List, Dict, Optional, Literal
 import logging
-import requests
 
 from atomic_agents.lib.base.base_tool import BaseTool, BaseToolConfig
 
 from src.agents.types import SearchResultItem, SearchToolInputSchema, SearchToolOutputSchema
 
-# Lock for thread-safe operations if needed
-lock = threading.Lock()
+
+# Bound on in-flight page fetches -- past this, extra concurrency just thrashes
+# DNS and per-host connection limits without speeding anything up
+_MAX_CONCURRENT_FETCHES = 16
+
+# Largest page body worth parsing -- anything bigger is almost never article
+# text, and 16 concurrent unbounded downloads could hold tens of MB in memory
+_MAX_RESPONSE_BYTES = 5 * 1024 * 1024
 
 
 ##############
@@ -35,6 +40,10 @@ class SearchTool(BaseTool):
     input_schema = SearchToolInputSchema
     output_schema = SearchToolOutputSchema
 
+    # Built once -- restrict parsing to the nodes we actually read
+    _TITLE_STRAINER = SoupStrainer("title")
+    _CONTENT_STRAINER = SoupStrainer(["p", "article", "main", "h1", "h2", "h3", "li"])
+
     def __init__(self, config: SearchToolConfig = SearchToolConfig()):
         """
         Initializes the SearxNGTool.
@@ -46,68 +55,118 @@ class SearchTool(BaseTool):
         super().__init__(config)
         self.base_url = config.base_url
         self.max_results = config.max_results
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+                          'Chrome/91.0.4472.124 Safari/537.36'
+        }
 
-    def extract_webpage_info(self, search_term: str, url: str) -> Dict[str, Optional[str]]:
+    def parse_webpage(self, url: str, html: bytes) -> Dict[str, Optional[str]]:
         """
-        Extract information from a webpage.
+        Extract information from fetched webpage HTML.
         Returns a dictionary with URL, title, published date, and content if available.
         """
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
-                          'Chrome/91.0.4472.124 Safari/537.36'
-        }
         result = {
-            'query': search_term,
             'url': url,
             'title': None,
             'content': None
         }
 
-        try:
-            # NO SOUP FOR YOU
-            soup = BeautifulSoup(requests.get(url).text, "html.parser")
-            result["content"] = soup.get_text()
+        # NO SOUP FOR YOU -- lxml is the C parser, and the strainers skip tree
+        # nodes we never look at
+        # One get_text over the strained tree -- iterating find_all(True) would
+        # re-emit nested nodes' text once per ancestor (li inside article, etc.)
+        soup = BeautifulSoup(html, "lxml", parse_only=self._CONTENT_STRAINER)
+        result["content"] = soup.get_text(" ", strip=True)
 
-            # Extract title
-            title_tag = soup.find('title')
-            result['title'] = title_tag.text if title_tag else None
+        # Extract title
+        title_soup = BeautifulSoup(html, "lxml", parse_only=self._TITLE_STRAINER)
+        title_tag = title_soup.find('title')
+        result['title'] = title_tag.text if title_tag else None
 
-        except Exception as e:
-            logging.error(f"Error processing {url}: {str(e)}")
         return result
 
-    def get_google_search_results(self, search_term: str) -> List[Dict[str, Optional[str]]]:
-        """
-        Perform a Google search for the given term and return the top N results with extracted info.
-        Uses parallel processing to fetch and parse webpages for a single search term.
-        """
-        results = []
-        urls = []
+    async def _fetch_webpage_info(
+            self,
+            client: httpx.AsyncClient,
+            semaphore: asyncio.Semaphore,
+            url: str
+    ) -> Dict[str, Optional[str]]:
+        """Fetch a single URL through the shared client, then parse off the event loop."""
+        result = {
+            'url': url,
+            'title': None,
+            'content': None
+        }
 
         try:
-            # Perform Google search and get top N URLs
-            logging.info(f"Searching for: {search_term}")
-            for i, url in enumerate(search(search_term)):
-                if i >= self.max_results: break
-                urls.append(url)
-                logging.info(f"Found URL for {search_term}: {url}")
-
-            # Process URLs in parallel using ThreadPoolExecutor
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_results) as executor:
-                # Submit all tasks
-                future_to_url = {executor.submit(self.extract_webpage_info, search_term, url): url for url in urls}
-                for future in concurrent.futures.as_completed(future_to_url):
-                    url = future_to_url[future]
-                    try:
-                        result = future.result()
-                        results.append(result)
-                        logging.info(f"Completed processing for {search_term}: {url}")
-                    except Exception as e:
-                        logging.error(f"Error processing {url} for {search_term}: {str(e)}")
-
+            async with semaphore:
+                # Stream with a byte cap so one huge page (a PDF dump, a data
+                # file) can't buffer unbounded memory per in-flight fetch
+                async with client.stream("GET", url, timeout=20) as response:
+                    declared = response.headers.get("content-length")
+                    if declared and int(declared) > _MAX_RESPONSE_BYTES:
+                        logging.warning(f"Skipping {url}: content-length {declared} exceeds cap")
+                        return result
+                    chunks, total = [], 0
+                    async for chunk in response.aiter_bytes():
+                        total += len(chunk)
+                        if total > _MAX_RESPONSE_BYTES:
+                            logging.warning(f"Skipping {url}: body exceeded {_MAX_RESPONSE_BYTES} bytes")
+                            return result
+                        chunks.append(chunk)
+            # Parsing is CPU-bound -- keep it off the event loop. bs4 sniffs the
+            # declared encoding from raw bytes, so no .text decode needed here.
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, self.parse_webpage, url, b"".join(chunks))
+            logging.info(f"Completed processing: {url}")
         except Exception as e:
-            logging.error(f"Error during Google search for {search_term}: {str(e)}")
+            logging.error(f"Error processing {url}: {str(e)}")
+        return result
 
+    def get_google_urls(self, search_term: str) -> List[str]:
+        """Perform a Google search for the given term and return the top N result URLs."""
+        urls = []
+        logging.info(f"Searching for: {search_term}")
+        for i, url in enumerate(search(search_term)):
+            if i >= self.max_results: break
+            urls.append(url)
+            logging.info(f"Found URL for {search_term}: {url}")
+        return urls
+
+    async def _gather_search_results(self, queries: List[str]) -> Dict[str, List[Dict[str, Optional[str]]]]:
+        """
+        Search all queries, then fetch every (query, url) pair through one shared
+        connection pool. A single event loop replaces the old nested thread pools,
+        so concurrency no longer costs O(queries x max_results) OS threads.
+        """
+        # googlesearch is synchronous -- run the searches in worker threads
+        url_lists = await asyncio.gather(
+            *[asyncio.to_thread(self.get_google_urls, term) for term in queries],
+            return_exceptions=True
+        )
+
+        pairs = []
+        for term, urls in zip(queries, url_lists):
+            if isinstance(urls, Exception):
+                logging.error(f"Error during Google search for {term}: {str(urls)}")
+                continue
+            pairs.extend((term, url) for url in urls)
+
+        # Different queries routinely surface the same URLs -- fetch and parse
+        # each distinct URL exactly once, then fan results back out per query
+        unique_urls = list(dict.fromkeys(url for _, url in pairs))
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+        limits = httpx.Limits(max_connections=_MAX_CONCURRENT_FETCHES, max_keepalive_connections=_MAX_CONCURRENT_FETCHES)
+        async with httpx.AsyncClient(headers=self.headers, limits=limits, follow_redirects=True) as client:
+            fetched = await asyncio.gather(
+                *[self._fetch_webpage_info(client, semaphore, url) for url in unique_urls]
+            )
+        info_by_url = dict(zip(unique_urls, fetched))
+
+        results = {term: [] for term in queries}
+        for term, url in pairs:
+            results[term].append({'query': term, **info_by_url[url]})
         return results
 
     def process_multiple_searches(self, params: SearchToolInputSchema) -> SearchToolOutputSchema:
@@ -115,24 +174,7 @@ class SearchTool(BaseTool):
         Process multiple search terms concurrently and return a dictionary mapping each term
         to its list of search results.
         """
-        results = {}
-
-        # Use ThreadPoolExecutor to process multiple search terms in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(params.queries)) as executor:
-            # Submit all search tasks for different terms
-            future_to_term = {
-                executor.submit(self.get_google_search_results, term): term
-                for term in params.queries
-            }
-            for future in concurrent.futures.as_completed(future_to_term):
-                term = future_to_term[future]
-                try:
-                    result = future.result()
-                    results[term] = result
-                    logging.info(f"Completed search for term: {term}")
-                except Exception as e:
-                    logging.error(f"Error processing search term {term}: {str(e)}")
-                    results[term] = []
+        results = asyncio.run(self._gather_search_results(params.queries))
 
         search_result_items = []
         for query in params.queries:
@@ -148,7 +190,7 @@ class SearchTool(BaseTool):
         """
         Runs the SearxNGTool synchronously with the given parameters.
 
-        This method creates an event loop in a separate thread to run the asynchronous operations.
+        This method creates an event loop to run the asynchronous fetch operations.
 
         Args:
             params (SearchToolInputSchema): The input parameters for the tool, adhering to the input schema.
@@ -175,4 +217,4 @@ if __name__ == "__main__":
     tool = SearchTool(SearchToolConfig(max_results=num_results))
     results = tool.run(params)
     for r in results:
-        print(r)
\ No newline at end of file
+        print(r)
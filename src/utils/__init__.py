@@ -1 +1,2 @@
-from .prompt_handler import PromptHandler
\ No newline at end of file
+from .embedding_functions import OpenAIEmbeddingFunction
+from .prompt_handler import PromptHandler
@@ -0,0 +1,241 @@
+from __future__ import annotations  # https://peps.python.org/pep-0563/
+
+import asyncio
+import base64
+from collections import OrderedDict
+import hashlib
+import logging
+import numpy as np
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+import time
+from typing import List, TYPE_CHECKING
+
+# chromadb must be imported here: the EmbeddingFunction protocol validates the
+# subclass's __call__ signature and wraps it at class-creation time, so the
+# base can't be deferred. openai and tiktoken stay lazy in __init__.
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+
+# Single C-level pass per string, cheaper than a .replace call per text
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " "})
+
+# Per-instance LRU bound for cached embeddings
+_CACHE_MAX = 10_000
+
+# Keep each request comfortably under the API's token and array-length limits
+# (1M tokens / 2048 items per request) so one oversized batch can't 413 the lot
+_TOKEN_BUDGET = 280_000
+_MAX_BATCH_ITEMS = 2048
+_HTTP_CLIENT = None
+
+
+def _shared_http_client() -> httpx.Client:
+    # Process-wide transport: every embedding-function instance shares one pool
+    # instead of rebuilding TCP+TLS state, and the raised limits keep burst
+    # ingest from queueing on httpx's small defaults. Sync only -- a cached
+    # AsyncClient's keep-alive connections stay bound to whichever event loop
+    # touched them first, and the next asyncio.run() would find them owned by
+    # a closed loop, so the async SDK clients manage their own transport.
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        import httpx
+        _HTTP_CLIENT = httpx.Client(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100), timeout=60
+        )
+    return _HTTP_CLIENT
+
+
+def _decode_embedding(value) -> np.ndarray:
+    """With encoding_format='base64' the API hands back raw float32 bytes;
+    tolerate float lists in case a proxy strips the option."""
+    if isinstance(value, str):
+        return np.frombuffer(base64.b64decode(value), dtype=np.float32)
+    return np.asarray(value, dtype=np.float32)
+
+
+class OpenAIEmbeddingFunction(EmbeddingFunction[Documents]):
+    """OpenAI embedding function, vendored from the chromadb helper so ingestion
+    can batch every request. The upstream version loops over texts one HTTP call
+    at a time when a deployment_id is set; the embeddings endpoint takes arrays
+    natively, so both paths here send the whole batch in a single request.
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        model_name: str = "text-embedding-ada-002",
+        organization_id: str = None,
+        api_base: str = None,
+        api_type: str = None,
+        api_version: str = None,
+        deployment_id: str = None,
+        default_headers: dict = None,
+        batch_size: int = 512,
+        max_in_flight: int = 8,
+    ):
+        try:
+            import openai
+        except ImportError:
+            raise ValueError(
+                "The openai python package is not installed. Please install it with `pip install openai`"
+            )
+        import tiktoken
+
+        try:
+            self._enc = tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            self._enc = tiktoken.get_encoding("cl100k_base")
+
+        self._model_name = model_name
+        self._deployment_id = deployment_id
+        self._batch_size = batch_size
+        self._max_in_flight = max_in_flight
+        self._cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+
+        # Transient 429/timeout/connection failures retry with backoff + jitter
+        # instead of losing the whole batch; a server-provided Retry-After is
+        # honored before the scheduled wait
+        def _honor_retry_after(retry_state):
+            exc = retry_state.outcome.exception()
+            if isinstance(exc, openai.RateLimitError) and exc.response is not None:
+                retry_after = exc.response.headers.get("retry-after")
+                if retry_after:
+                    try:
+                        time.sleep(float(retry_after))
+                    except ValueError:
+                        pass
+
+        self._create_with_retry = retry(
+            wait=wait_exponential_jitter(initial=1, max=30),
+            stop=stop_after_attempt(6),
+            retry=retry_if_exception_type(
+                (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError)
+            ),
+            before_sleep=_honor_retry_after,
+        )(self._create_batch)
+
+        # The v1 SDK clients ignore the legacy openai.api_* module globals, so
+        # configuration goes straight into the constructors
+        if api_type == "azure":
+            self._client = openai.AzureOpenAI(
+                api_key=api_key, api_version=api_version, azure_endpoint=api_base,
+                azure_deployment=deployment_id, default_headers=default_headers,
+                http_client=_shared_http_client()
+            ).embeddings
+            self._aclient = openai.AsyncAzureOpenAI(
+                api_key=api_key, api_version=api_version, azure_endpoint=api_base,
+                azure_deployment=deployment_id, default_headers=default_headers
+            ).embeddings
+            # The deployment is bound on the client; no per-request extra_body
+            self._deployment_id = None
+        else:
+            self._client = openai.OpenAI(
+                api_key=api_key, organization=organization_id, base_url=api_base,
+                default_headers=default_headers, http_client=_shared_http_client()
+            ).embeddings
+            self._aclient = openai.AsyncOpenAI(
+                api_key=api_key, organization=organization_id, base_url=api_base,
+                default_headers=default_headers
+            ).embeddings
+
+    def __call__(self, input: Documents) -> Embeddings:
+        # The parameter must be named ``input``: chromadb validates the
+        # signature and calls us with input= as a keyword.
+        # replace newlines, which can negatively affect performance
+        texts = [t.translate(_NL_TABLE) for t in input]
+
+        # LRU on content hash: re-indexing overlapping corpora skips the
+        # round-trip (and the API bill) for texts already embedded
+        keys = [hashlib.blake2b(t.encode(), digest_size=16).digest() for t in texts]
+        embeddings: List = [None] * len(texts)
+        misses = []
+        for i, key in enumerate(keys):
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                embeddings[i] = cached
+            else:
+                misses.append(i)
+
+        if misses:
+            miss_texts = [texts[i] for i in misses]
+            for batch in self._pack_batches(miss_texts):
+                response = self._create_with_retry([miss_texts[j] for j in batch])
+                # .index orders within the request; splice back into input order
+                sorted_embeddings = sorted(response.data, key=lambda e: e.index)
+                for j, result in zip(batch, sorted_embeddings):
+                    i = misses[j]
+                    row = _decode_embedding(result.embedding)
+                    embeddings[i] = row
+                    self._cache[keys[i]] = row
+                    if len(self._cache) > _CACHE_MAX:
+                        self._cache.popitem(last=False)
+
+        # One contiguous (N, D) float32 block instead of N lists of boxed floats
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def _create_batch(self, batch_texts: List[str]):
+        # One request for the whole batch -- Azure deployments accept arrays
+        # too, so the deployment path no longer serializes N round-trips
+        if self._deployment_id is not None:
+            return self._client.create(
+                model=self._model_name, input=batch_texts, encoding_format="base64",
+                extra_body={"deployment_id": self._deployment_id}
+            )
+        return self._client.create(
+            model=self._model_name, input=batch_texts, encoding_format="base64"
+        )
+
+    def _pack_batches(self, texts: List[str]) -> List[List[int]]:
+        """Greedily pack text indices into sub-batches under the token budget.
+
+        Token lengths come from one encode_ordinary_batch call, so an oversized
+        input splits into fully-loaded requests instead of failing the whole
+        batch and falling back to per-element retries.
+        """
+        lens = [len(toks) for toks in self._enc.encode_ordinary_batch(texts)]
+        batches, batch, total = [], [], 0
+        for i, n in enumerate(lens):
+            if batch and (total + n > _TOKEN_BUDGET or len(batch) == _MAX_BATCH_ITEMS):
+                batches.append(batch)
+                batch, total = [], 0
+            batch.append(i)
+            total += n
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def aembed(self, texts: List[str]) -> Embeddings:
+        """Embed a large batch by firing sub-batches concurrently.
+
+        One blocking create() caps throughput at a single round-trip; here the
+        texts are sliced into _batch_size chunks dispatched via asyncio.gather,
+        with a semaphore so a huge corpus doesn't stampede into rate limits.
+        """
+        texts = [t.translate(_NL_TABLE) for t in texts]
+        semaphore = asyncio.Semaphore(self._max_in_flight)
+
+        async def _create(chunk):
+            async with semaphore:
+                if self._deployment_id is not None:
+                    return await self._aclient.create(
+                        model=self._model_name, input=chunk, encoding_format="base64",
+                        extra_body={"deployment_id": self._deployment_id}
+                    )
+                return await self._aclient.create(
+                    model=self._model_name, input=chunk, encoding_format="base64"
+                )
+
+        chunks = [texts[i:i + self._batch_size] for i in range(0, len(texts), self._batch_size)]
+        responses = await asyncio.gather(*[_create(chunk) for chunk in chunks])
+
+        # Indices are per-request, so reassemble chunk by chunk in dispatch order
+        embeddings = []
+        for response in responses:
+            embeddings.extend(_decode_embedding(r.embedding) for r in sorted(response.data, key=lambda e: e.index))
+        return np.asarray(embeddings, dtype=np.float32)
@@ -1,31 +1,111 @@
 import yaml as yml
-import simplejson as sj
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    # libyaml bindings parse ~10x faster than the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+import os
 from pathlib import Path
 import logging
 from typing import Literal
 
 logger = logging.getLogger(__name__)
 
+# Parsed prompt YAML shared across PromptHandler instances, keyed on
+# (path, mtime_ns, size) so edits invalidate automatically
+_YAML_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_CACHE_MAX = 100
+
+# Resolved once -- constructing many handlers shouldn't re-walk __file__ parents
+_BASE_DIR = Path(__file__).resolve().parent.parent.parent
+_PROMPTS_DIR = _BASE_DIR / "prompts"
+
 
 class PromptHandler:
     """Class to load prompts from a YAML file. Putting it here to make it accessible to the workbench"""
+
+    __slots__ = ("prompt_file", "as_dict")
+
     def __init__(self, prompt_file):
-        self.__base_dir = Path(__file__).parent.parent.parent
-        self.prompt_file = self.__base_dir / "prompts" / prompt_file
+        self.prompt_file = _PROMPTS_DIR / prompt_file
         self.as_dict = None
 
     def read(self):
+        """Parsed prompt dict. Cached per instance and in the module-level cache,
+        so treat the result as read-only."""
         if self.as_dict is not None: return self.as_dict
-        with open(self.prompt_file, "r") as f:
-            self.as_dict = yml.safe_load(f)
+
+        st = self.prompt_file.stat()
+        key = (str(self.prompt_file), st.st_mtime_ns, st.st_size)
+        cached = _YAML_CACHE.get(key)
+        if cached is not None:
+            _YAML_CACHE.move_to_end(key)
+            self.as_dict = cached
+            return self.as_dict
+
+        # JSON sidecar: parsing JSON is ~10x faster than YAML, so each cold
+        # process after the first reads prompts/.cache/<file>.json instead
+        sidecar = self.prompt_file.parent / ".cache" / (self.prompt_file.name + ".json")
+        if sidecar.exists() and sidecar.stat().st_mtime_ns >= st.st_mtime_ns:
+            self.as_dict = json.loads(sidecar.read_bytes())
+        else:
+            with open(self.prompt_file, "r") as f:
+                self.as_dict = yml.load(f, Loader=SafeLoader)
+            try:
+                sidecar.parent.mkdir(exist_ok=True)
+                tmp = sidecar.with_suffix(sidecar.suffix + ".tmp")
+                tmp.write_text(json.dumps(self.as_dict))
+                os.replace(tmp, sidecar)
+            except OSError as e:
+                # e.g. read-only prompts dir: the sidecar is only a cache, so
+                # just parse the YAML on every cold read
+                logger.warning(f"Could not write prompt cache {sidecar}: {e}")
+
+        _YAML_CACHE[key] = self.as_dict
+        if len(_YAML_CACHE) > _CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
         return self.as_dict
 
+    @classmethod
+    def load_many(cls, names: list) -> dict:
+        """Read several prompt files at once, mapping name -> parsed dict.
+
+        File I/O releases the GIL, so reads of many small files overlap in a
+        thread pool; with the module-level cache, repeat calls cost nothing.
+        """
+        if not names:
+            return {}
+        handlers = [cls(name) for name in names]
+        with ThreadPoolExecutor(max_workers=min(8, len(names))) as ex:
+            dicts = list(ex.map(lambda h: h.read(), handlers))
+        return dict(zip(names, dicts))
+
     def write(self, prompt_dict, fmt: Literal["yml", "json"]="yml"):
+        """Serialize to a tmp file, then os.replace it in. A crash mid-write can't
+        tear the prompt file, and concurrent read()s see either the old or the new
+        content -- which also keeps the mtime/size cache keys trustworthy."""
+        if fmt not in ("yml", "json"):
+            raise ValueError("Format must be either 'yml' or 'json'")
+
+        tmp = self.prompt_file.with_suffix(self.prompt_file.suffix + ".tmp")
         if fmt == "json":
-            with open(self.prompt_file, "w") as f:
-                sj.dump(prompt_dict, f, indent=4)
-        elif fmt == "yml":
-            with open(self.prompt_file, "w") as f:
-                yml.dump(prompt_dict, f)
+            # Deferred -- no point importing a serializer on the hot read path
+            try:
+                import orjson
+            except ImportError:
+                orjson = None
+            if orjson is not None:
+                with open(tmp, "wb") as f:
+                    f.write(orjson.dumps(prompt_dict, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp, "w") as f:
+                    json.dump(prompt_dict, f, indent=4)
         else:
-            raise ValueError("Format must be either 'yml' or 'json'")
\ No newline at end of file
+            with open(tmp, "w") as f:
+                yml.dump(prompt_dict, f, Dumper=SafeDumper)
+        os.replace(tmp, self.prompt_file)
\ No newline at end of file